@@ -13,6 +13,8 @@ for sep in seps:
     if sep not in _excluded_clean_chars:
         clean_chars += sep
 
+_whitespaces_re = re.compile(' +')
+
 
 def _potential_before(i, input_string):
     """
@@ -68,11 +70,11 @@ def cleanup(input_string):
     if indices:
         clean_list = list(clean_string)
 
-        potential_indices = []
+        potential_indices = set()
 
         for i in indices:
             if _potential_before(i, input_string) and _potential_after(i, input_string):
-                potential_indices.append(i)
+                potential_indices.add(i)
 
         replace_indices = []
 
@@ -88,7 +90,7 @@ def cleanup(input_string):
 
     clean_string = strip(clean_string, ''.join([c for c in seps if c not in dots]))
 
-    clean_string = re.sub(' +', ' ', clean_string)
+    clean_string = _whitespaces_re.sub(' ', clean_string)
     return clean_string
 
 
@@ -3,7 +3,6 @@
 """
 Processors
 """
-from collections import defaultdict
 import copy
 
 import six
@@ -67,8 +66,9 @@ class EquivalentHoles(Rule):
         for filepath in marker_sorted(matches.markers.named('path'), matches):
             holes = matches.holes(start=filepath.start, end=filepath.end, formatter=cleanup)
             for name in matches.names:
+                named_matches = matches.named(name)
                 for hole in list(holes):
-                    for current_match in matches.named(name):
+                    for current_match in named_matches:
                         if isinstance(current_match.value, six.string_types) and \
                                         hole.value.lower() == current_match.value.lower():
                             if 'equivalent-ignore' in current_match.tags:
@@ -99,7 +99,7 @@ class RemoveAmbiguous(Rule):
         fileparts = marker_sorted(matches.markers.named('path'), matches)
 
         previous_fileparts_names = set()
-        values = defaultdict(list)
+        values = set()  # (name, value) tuples
 
         to_remove = []
         for filepart in fileparts:
@@ -109,11 +109,10 @@ class RemoveAmbiguous(Rule):
             for match in filepart_matches:
                 filepart_names.add(match.name)
                 if match.name in previous_fileparts_names:
-                    if match.value not in values[match.name]:
+                    if (match.name, match.value) not in values:
                         to_remove.append(match)
                 else:
-                    if match.value not in values[match.name]:
-                        values[match.name].append(match.value)
+                    values.add((match.name, match.value))
 
             previous_fileparts_names.update(filepart_names)
 
@@ -24,10 +24,10 @@ def audio_codec():
     rebulk.regex("MP3", "LAME", r"LAME(?:\d)+-?(?:\d)+", value="MP3")
     rebulk.regex("DolbyDigital", "Dolby-Digital", "DD", value="DolbyDigital")
     rebulk.regex("DolbyAtmos", "Dolby-Atmos", "Atmos", value="DolbyAtmos")
-    rebulk.regex("AAC", value="AAC")
+    rebulk.string("AAC", value="AAC", properties={"audio_codec": ["AAC"]})
     rebulk.regex("AC3D?", value="AC3")
-    rebulk.regex("Flac", value="FLAC")
-    rebulk.regex("DTS", value="DTS")
+    rebulk.string("Flac", value="FLAC", properties={"audio_codec": ["FLAC"]})
+    rebulk.string("DTS", value="DTS", properties={"audio_codec": ["DTS"]})
     rebulk.regex("True-?HD", value="TrueHD")
 
     rebulk.defaults(name="audio_profile")
@@ -46,7 +46,7 @@ def audio_codec():
     rebulk.string('2ch', 'stereo', value='2.0')
     rebulk.string('1ch', 'mono', value='1.0')
 
-    rebulk.rules(DtsRule, AacRule, Ac3Rule, AudioValidatorRule, HqConflictRule)
+    rebulk.rules(AudioProfileRule, AudioValidatorRule, HqConflictRule)
 
     return rebulk
 
@@ -81,66 +81,37 @@ class AudioValidatorRule(Rule):
 
 class AudioProfileRule(Rule):
     """
-    Abstract rule to validate audio profiles
+    Rule to validate audio profiles.
+
+    Each audio_profile is tagged with the audio_codec value it belongs to, so profiles of all codecs are validated
+    in a single pass.
     """
     priority = 64
     dependency = AudioValidatorRule
     consequence = RemoveMatch
 
-    def __init__(self, codec):
-        super(AudioProfileRule, self).__init__()
-        self.codec = codec
-
     def when(self, matches, context):
-        profile_list = matches.named('audio_profile', lambda match: self.codec in match.tags)
         ret = []
-        for profile in profile_list:
-            codec = matches.previous(profile, lambda match: match.name == 'audio_codec' and match.value == self.codec)
-            if not codec:
-                codec = matches.next(profile, lambda match: match.name == 'audio_codec' and match.value == self.codec)
-            if not codec:
+        for profile in matches.named('audio_profile'):
+            tags = profile.tags
+            if any(match.name == 'audio_codec' and match.value in tags for match in matches.previous(profile)):
+                continue
+            if not any(match.name == 'audio_codec' and match.value in tags for match in matches.next(profile)):
                 ret.append(profile)
         return ret
 
 
-class DtsRule(AudioProfileRule):
-    """
-    Rule to validate DTS profile
-    """
-
-    def __init__(self):
-        super(DtsRule, self).__init__("DTS")
-
-
-class AacRule(AudioProfileRule):
-    """
-    Rule to validate AAC profile
-    """
-
-    def __init__(self):
-        super(AacRule, self).__init__("AAC")
-
-
-class Ac3Rule(AudioProfileRule):
-    """
-    Rule to validate AC3 profile
-    """
-
-    def __init__(self):
-        super(Ac3Rule, self).__init__("AC3")
-
-
 class HqConflictRule(Rule):
     """
     Solve conflict between HQ from other property and from audio_profile.
     """
 
-    dependency = [DtsRule, AacRule, Ac3Rule]
+    dependency = AudioProfileRule
     consequence = RemoveMatch
 
     def when(self, matches, context):
         hq_audio = matches.named('audio_profile', lambda match: match.value == 'HQ')
-        hq_audio_spans = [match.span for match in hq_audio]
+        hq_audio_spans = set(match.span for match in hq_audio)
         hq_other = matches.named('other', lambda match: match.span in hq_audio_spans)
 
         if hq_other:
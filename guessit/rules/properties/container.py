@@ -10,6 +10,15 @@ from ..common.validators import seps_surround
 from ...reutils import build_or_pattern
 
 
+_subtitles_exts = ['srt', 'idx', 'sub', 'ssa', 'ass']
+_info_exts = ['nfo']
+_videos_exts = ['3g2', '3gp', '3gp2', 'asf', 'avi', 'divx', 'flv', 'm4v', 'mk2',
+                'mka', 'mkv', 'mov', 'mp4', 'mp4a', 'mpeg', 'mpg', 'ogg', 'ogm',
+                'ogv', 'qt', 'ra', 'ram', 'rm', 'ts', 'wav', 'webm', 'wma', 'wmv',
+                'iso', 'vob']
+_torrent_exts = ['torrent']
+
+
 def container():
     """
     Builder for rebulk object.
@@ -25,24 +34,16 @@ def container():
                     other.name == 'container' and 'extension' not in other.tags
                     else '__default__')
 
-    subtitles = ['srt', 'idx', 'sub', 'ssa', 'ass']
-    info = ['nfo']
-    videos = ['3g2', '3gp', '3gp2', 'asf', 'avi', 'divx', 'flv', 'm4v', 'mk2',
-              'mka', 'mkv', 'mov', 'mp4', 'mp4a', 'mpeg', 'mpg', 'ogg', 'ogm',
-              'ogv', 'qt', 'ra', 'ram', 'rm', 'ts', 'wav', 'webm', 'wma', 'wmv',
-              'iso', 'vob']
-    torrent = ['torrent']
-
     if REGEX_AVAILABLE:
-        rebulk.regex(r'\.\L<exts>$', exts=subtitles, tags=['extension', 'subtitle'])
-        rebulk.regex(r'\.\L<exts>$', exts=info, tags=['extension', 'info'])
-        rebulk.regex(r'\.\L<exts>$', exts=videos, tags=['extension', 'video'])
-        rebulk.regex(r'\.\L<exts>$', exts=torrent, tags=['extension', 'torrent'])
+        rebulk.regex(r'\.\L<exts>$', exts=_subtitles_exts, tags=['extension', 'subtitle'])
+        rebulk.regex(r'\.\L<exts>$', exts=_info_exts, tags=['extension', 'info'])
+        rebulk.regex(r'\.\L<exts>$', exts=_videos_exts, tags=['extension', 'video'])
+        rebulk.regex(r'\.\L<exts>$', exts=_torrent_exts, tags=['extension', 'torrent'])
     else:
-        rebulk.regex(r'\.'+build_or_pattern(subtitles)+'$', exts=subtitles, tags=['extension', 'subtitle'])
-        rebulk.regex(r'\.'+build_or_pattern(info)+'$', exts=info, tags=['extension', 'info'])
-        rebulk.regex(r'\.'+build_or_pattern(videos)+'$', exts=videos, tags=['extension', 'video'])
-        rebulk.regex(r'\.'+build_or_pattern(torrent)+'$', exts=torrent, tags=['extension', 'torrent'])
+        rebulk.regex(r'\.'+build_or_pattern(_subtitles_exts)+'$', exts=_subtitles_exts, tags=['extension', 'subtitle'])
+        rebulk.regex(r'\.'+build_or_pattern(_info_exts)+'$', exts=_info_exts, tags=['extension', 'info'])
+        rebulk.regex(r'\.'+build_or_pattern(_videos_exts)+'$', exts=_videos_exts, tags=['extension', 'video'])
+        rebulk.regex(r'\.'+build_or_pattern(_torrent_exts)+'$', exts=_torrent_exts, tags=['extension', 'torrent'])
 
     rebulk.defaults(name='container',
                     validator=seps_surround,
@@ -52,8 +53,8 @@ def container():
                                       'video_codec'] or other.name == 'container' and 'extension' in other.tags
                     else '__default__')
 
-    rebulk.string(*[sub for sub in subtitles if sub not in ['sub']], tags=['subtitle'])
-    rebulk.string(*videos, tags=['video'])
-    rebulk.string(*torrent, tags=['torrent'])
+    rebulk.string(*[sub for sub in _subtitles_exts if sub not in ['sub']], tags=['subtitle'])
+    rebulk.string(*_videos_exts, tags=['video'])
+    rebulk.string(*_torrent_exts, tags=['torrent'])
 
     return rebulk
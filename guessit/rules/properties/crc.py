@@ -34,6 +34,9 @@ _DIGIT = 0
 _LETTER = 1
 _OTHER = 2
 
+_char_types = dict([(c, _DIGIT) for c in '0123456789'] +
+                   [(c, _LETTER) for c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'])
+
 _idnum = re.compile(r'(?P<uuid>[a-zA-Z0-9-]{20,})')  # 1.0, (0, 0))
 
 
@@ -58,16 +61,12 @@ def guess_idnumber(string):
 
         last = _LETTER
         for c in result['uuid']:
-            if c in '0123456789':
-                ci = _DIGIT
-            elif c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                ci = _LETTER
+            ci = _char_types.get(c, _OTHER)
+            if ci == _LETTER:
                 if c != last_letter:
                     switch_letter_count += 1
                 last_letter = c
                 letter_count += 1
-            else:
-                ci = _OTHER
 
             if ci != last:
                 switch_count += 1
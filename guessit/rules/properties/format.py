@@ -8,6 +8,7 @@ from rebulk.remodule import re
 from rebulk import Rebulk, RemoveMatch, Rule
 from ..common import dash
 from ..common.validators import seps_before, seps_after
+from ...reutils import build_or_pattern
 
 
 def format_():
@@ -19,24 +20,29 @@ def format_():
     rebulk = Rebulk().regex_defaults(flags=re.IGNORECASE, abbreviations=[dash])
     rebulk.defaults(name="format")
 
-    rebulk.regex("VHS", "VHS-?Rip", value="VHS")
-    rebulk.regex("CAM", "CAM-?Rip", "HD-?CAM", value="Cam")
-    rebulk.regex("TELESYNC", "TS", "HD-?TS", value="Telesync")
-    rebulk.regex("WORKPRINT", "WP", value="Workprint")
-    rebulk.regex("TELECINE", "TC", value="Telecine")
-    rebulk.regex("PPV", "PPV-?Rip", value="PPV")  # Pay Per View
+    # Alternatives of a same format starting with the same characters are combined in a single regular expression,
+    # so the input string is scanned once for them instead of once per alternative. Longest alternatives must come
+    # first. Alternatives starting differently are kept as separate patterns, as a single regular expression can't
+    # return overlapping matches ("HD-CAMRip" would lose "CAMRip" behind "HD-CAM").
+    rebulk.regex(build_or_pattern(["VHS-?Rip", "VHS"]), value="VHS")
+    rebulk.regex(build_or_pattern(["CAM-?Rip", "CAM"]), "HD-?CAM", value="Cam")
+    rebulk.regex(build_or_pattern(["TELESYNC", "TS"]), "HD-?TS", value="Telesync")
+    rebulk.regex(build_or_pattern(["WORKPRINT", "WP"]), value="Workprint")
+    rebulk.regex(build_or_pattern(["TELECINE", "TC"]), value="Telecine")
+    rebulk.regex(build_or_pattern(["PPV-?Rip", "PPV"]), value="PPV")  # Pay Per View
     rebulk.regex("SD-?TV", "SD-?TV-?Rip", "Rip-?SD-?TV", "TV-?Rip",
                  "Rip-?TV", value="TV")  # TV is too common to allow matching
-    rebulk.regex("DVB-?Rip", "DVB", "PD-?TV", value="DVB")
-    rebulk.regex("DVD", "DVD-?Rip", "VIDEO-?TS", "DVD-?R(?:$|(?!E))",  # "DVD-?R(?:$|^E)" => DVD-Real ...
-                 "DVD-?9", "DVD-?5", value="DVD")
+    rebulk.regex(build_or_pattern(["DVB-?Rip", "DVB"]), "PD-?TV", value="DVB")
+    rebulk.regex(build_or_pattern(["DVD-?Rip", "DVD-?R(?:$|(?!E))",  # "DVD-?R(?:$|^E)" => DVD-Real ...
+                                   "DVD-?9", "DVD-?5", "DVD"]), "VIDEO-?TS", value="DVD")
 
     rebulk.regex("HD-?TV", "TV-?RIP-?HD", "HD-?TV-?RIP", "HD-?RIP", value="HDTV")
-    rebulk.regex("VOD", "VOD-?Rip", value="VOD")
+    rebulk.regex(build_or_pattern(["VOD-?Rip", "VOD"]), value="VOD")
     rebulk.regex("WEB-?Rip", value="WEBRip")
-    rebulk.regex("WEB-?DL", "WEB-?HD", "WEB", value="WEB-DL")
-    rebulk.regex("HD-?DVD-?Rip", "HD-?DVD", value="HD-DVD")
-    rebulk.regex("Blu-?ray(?:-?Rip)?", "B[DR]", "B[DR]-?Rip", "BD[59]", "BD25", "BD50", value="BluRay")
+    rebulk.regex(build_or_pattern(["WEB-?DL", "WEB-?HD", "WEB"]), value="WEB-DL")
+    rebulk.regex(build_or_pattern(["HD-?DVD-?Rip", "HD-?DVD"]), value="HD-DVD")
+    rebulk.regex(build_or_pattern(["Blu-?ray(?:-?Rip)?", "B[DR]-?Rip", "BD25", "BD50", "BD[59]", "B[DR]"]),
+                 value="BluRay")
 
     rebulk.rules(ValidateFormat)
 
@@ -52,15 +58,19 @@ class ValidateFormat(Rule):
 
     def when(self, matches, context):
         ret = []
+        # Screener matches are looked up once, so ranges are only searched when at least one exists.
+        has_screener = bool(matches.named('other', lambda match: match.value == 'Screener'))
         for format_match in matches.named('format'):
             if not seps_before(format_match) and \
-                    not matches.range(format_match.start - 1, format_match.start - 2,
-                                      lambda match: match.name == 'other' and match.value == 'Screener'):
+                    not (has_screener and
+                         matches.range(format_match.start - 1, format_match.start - 2,
+                                       lambda match: match.name == 'other' and match.value == 'Screener')):
                 ret.append(format_match)
                 continue
             if not seps_after(format_match) and \
-                    not matches.range(format_match.end, format_match.end + 1,
-                                      lambda match: match.name == 'other' and match.value == 'Screener'):
+                    not (has_screener and
+                         matches.range(format_match.end, format_match.end + 1,
+                                       lambda match: match.name == 'other' and match.value == 'Screener')):
                 ret.append(format_match)
                 continue
         return ret
@@ -125,10 +125,10 @@ def find_languages(string, context=None):
 
     matches = []
     for word_match in iter_words(string):
-        word = word_match.value
+        word = word_match.value.lower()
         start, end = word_match.span
 
-        lang_word = word.lower()
+        lang_word = word
         key = 'language'
         for prefix in subtitle_prefixes:
             if lang_word.startswith(prefix):
@@ -141,7 +141,7 @@ def find_languages(string, context=None):
         for prefix in lang_prefixes:
             if lang_word.startswith(prefix):
                 lang_word = lang_word[len(prefix):]
-        if lang_word not in common_words and word.lower() not in common_words:
+        if lang_word not in common_words and word not in common_words:
             try:
                 lang = babelfish.Language.fromguessit(lang_word)
                 match = (start, end, {'name': key, 'value': lang})
@@ -11,6 +11,7 @@ from rebulk import Rebulk, Rule, RemoveMatch, POST_PROCESS, AppendMatch
 from ..common import dash
 from ..common import seps
 from ..common.validators import seps_surround
+from ...reutils import build_or_pattern
 from guessit.rules.common.formatters import raw_cleanup
 
 
@@ -39,14 +40,11 @@ def other():
     rebulk.string('R5', 'RC', value='R5')
     rebulk.regex('Pre-?Air', value='Preair')
 
-    for value in (
-            'Screener', 'Remux', 'Remastered', '3D', 'HD', 'mHD', 'HDLight', 'HQ', 'DDC', 'HR', 'PAL', 'SECAM', 'NTSC',
-            'CC', 'LD', 'MD', 'XXX'):
-        rebulk.string(value, value=value)
+    _canonical_regex(rebulk, 'Screener', 'Remux', 'Remastered', '3D', 'HD', 'mHD', 'HDLight', 'HQ', 'DDC', 'HR', 'PAL',
+                     'SECAM', 'NTSC', 'CC', 'LD', 'MD', 'XXX')
 
-    for value in ('Limited', 'Complete', 'Classic', 'Unrated', 'LiNE', 'Bonus', 'Trailer', 'FINAL', 'Retail', 'Uncut',
-                  'Extended', 'Extended Cut'):
-        rebulk.string(value, value=value, tags=['has-neighbor', 'release-group-prefix'])
+    _canonical_regex(rebulk, 'Limited', 'Complete', 'Classic', 'Unrated', 'LiNE', 'Bonus', 'Trailer', 'FINAL', 'Retail',
+                     'Uncut', 'Extended', 'Extended Cut', tags=['has-neighbor', 'release-group-prefix'])
 
     rebulk.string('VO', 'OV', value='OV', tags='has-neighbor')
 
@@ -58,6 +56,41 @@ def other():
     return rebulk
 
 
+def _canonical_regex(rebulk, *values, **kwargs):
+    """
+    Register literal other values in a single regular expression, so the input string is scanned once for most of them.
+
+    Value of each match is the registered literal, whatever the case of the input string.
+
+    Values starting with another value ("Extended Cut" and "Extended") are registered as separate string patterns,
+    as a single regular expression would never give the shorter one when the longer one is rejected by validator.
+    :param rebulk:
+    :type rebulk: Rebulk
+    :param values: literal values to match
+    :type values: str
+    :param kwargs: additional pattern options
+    :type kwargs: dict
+    :return:
+    :rtype:
+    """
+    lower_values = [value.lower() for value in values]
+    alternatives = []
+    for value in values:
+        lower_value = value.lower()
+        if any(other != lower_value and lower_value.startswith(other) for other in lower_values):
+            rebulk.string(value, value=value, **kwargs)
+        else:
+            alternatives.append(value)
+
+    if alternatives:
+        # As no alternative starts with another one, their order doesn't matter.
+        canonical_values = dict((value.lower(), value) for value in alternatives)
+        rebulk.regex(build_or_pattern(alternatives, escape=True),
+                     formatter=lambda raw: canonical_values[raw.lower()],
+                     properties={'other': alternatives},
+                     **kwargs)
+
+
 class ProperCountRule(Rule):
     """
     Add proper_count property
@@ -38,13 +38,16 @@ def clean_groupname(string):
     :rtype:
     """
     string = string.strip(groupname_seps)
+    lower_string = string.lower()
     for forbidden in forbidden_groupnames:
-        if string.lower().startswith(forbidden):
+        if lower_string.startswith(forbidden):
             string = string[len(forbidden):]
             string = string.strip(groupname_seps)
-        if string.lower().endswith(forbidden):
+            lower_string = string.lower()
+        if lower_string.endswith(forbidden):
             string = string[:len(forbidden)]
             string = string.strip(groupname_seps)
+            lower_string = string.lower()
     return string
 
 
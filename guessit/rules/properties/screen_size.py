@@ -8,6 +8,41 @@ from rebulk.remodule import re
 from rebulk import Rebulk, Rule, RemoveMatch
 from ..common.validators import seps_surround
 from guessit.rules.common import dash
+from ...reutils import build_or_pattern
+
+_digits_re = re.compile(r'\d+')
+_resolution_prefix = r'(?:\d{3,}(?:x|\*))?'
+_screen_size_re = re.compile(_resolution_prefix + r'(\d{3,4})(i?)', re.IGNORECASE)
+
+# Heights sharing the same digits must have their longest alternatives first.
+_screen_size_patterns = [r'360(?:i|p?x?)',
+                         r'368(?:i|p?x?)',
+                         r'480(?:i|p?x?)',
+                         r'576(?:i|p?x?)',
+                         r'720hd',
+                         r'720(?:i|p?(?:50|60)?x?)',
+                         r'900(?:i|p?x?)',
+                         r'1080i',
+                         r'1080hd',
+                         r'1080(?:p(?:50|60)?)?x?',
+                         r'2160(?:i|p?x?)']
+_screen_size_values = ['360p', '368p', '480p', '576p', '720p', '900p', '1080i', '1080p', '4K']
+
+
+def _screen_size_value(value):
+    """
+    Formatter for screen_size value, from height and scan type of the raw value.
+    :param value:
+    :type value: str
+    :return:
+    :rtype: str
+    """
+    height, interlaced = _screen_size_re.match(value).groups()
+    if height == '2160':
+        return '4K'
+    if height == '1080' and interlaced:
+        return '1080i'
+    return height + 'p'
 
 
 def screen_size():
@@ -32,21 +67,11 @@ def screen_size():
     rebulk = Rebulk().regex_defaults(flags=re.IGNORECASE)
     rebulk.defaults(name="screen_size", validator=seps_surround, conflict_solver=conflict_solver)
 
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?360(?:i|p?x?)", value="360p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?368(?:i|p?x?)", value="368p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?480(?:i|p?x?)", value="480p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?576(?:i|p?x?)", value="576p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?720(?:i|p?(?:50|60)?x?)", value="720p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?720(?:p(?:50|60)?x?)", value="720p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?720hd", value="720p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?900(?:i|p?x?)", value="900p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?1080i", value="1080i")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?1080p?x?", value="1080p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?1080(?:p(?:50|60)?x?)", value="1080p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?1080hd", value="1080p")
-    rebulk.regex(r"(?:\d{3,}(?:x|\*))?2160(?:i|p?x?)", value="4K")
-
-    _digits_re = re.compile(r'\d+')
+    # All screen sizes are matched by a single regular expression, and the value is computed from the matched
+    # height and scan type.
+    rebulk.regex(_resolution_prefix + build_or_pattern(_screen_size_patterns),
+                 formatter=_screen_size_value,
+                 properties={'screen_size': _screen_size_values})
 
     rebulk.defaults(name="screen_size", validator=seps_surround)
     rebulk.regex(r'\d{3,}-?(?:x|\*)-?\d{3,}',
@@ -43,30 +43,22 @@ class TypeProcessor(CustomRule):
         if option_type:
             return option_type
 
-        episode = matches.named('episode')
-        season = matches.named('season')
-        episode_details = matches.named('episode_details')
-
-        if episode or season or episode_details:
+        # Each query is only performed when previous ones did not already decide the type.
+        if matches.named('episode') or matches.named('season') or matches.named('episode_details'):
             return 'episode'
 
-        film = matches.named('film')
-        if film:
+        if matches.named('film'):
             return 'movie'
 
         year = matches.named('year')
-        date = matches.named('date')
 
-        if date and not year:
+        if not year and matches.named('date'):
             return 'episode'
 
-        bonus = matches.named('bonus')
-        if bonus and not year:
+        if not year and matches.named('bonus'):
             return 'episode'
 
-        crc32 = matches.named('crc32')
-        anime_release_group = matches.named('release_group', lambda match: 'anime' in match.tags)
-        if crc32 and anime_release_group:
+        if matches.named('crc32') and matches.named('release_group', lambda match: 'anime' in match.tags):
             return 'episode'
 
         return 'movie'
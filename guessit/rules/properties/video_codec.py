@@ -20,9 +20,9 @@ def video_codec():
     rebulk.defaults(name="video_codec", validator=seps_surround)
 
     rebulk.regex(r"Rv\d{2}", value="Real")
-    rebulk.regex("Mpeg2", value="Mpeg2")
-    rebulk.regex("DVDivX", "DivX", value="DivX")
-    rebulk.regex("XviD", value="XviD")
+    rebulk.string("Mpeg2", value="Mpeg2", properties={"video_codec": ["Mpeg2"]})
+    rebulk.string("DVDivX", "DivX", value="DivX", properties={"video_codec": ["DivX"]})
+    rebulk.string("XviD", value="XviD", properties={"video_codec": ["XviD"]})
     rebulk.regex("[hx]-?264(?:-?AVC(HD)?)?", "MPEG-?4(?:-?AVC(HD)?)", "AVCHD", value="h264")
     rebulk.regex("[hx]-?265(?:-?HEVC)?", "HEVC", value="h265")
 
@@ -37,8 +37,10 @@ def video_codec():
     rebulk.string('XP', 'EP', value='XP', tags='video_profile.rule')
     rebulk.string('MP', value='MP', tags='video_profile.rule')
     rebulk.string('HP', 'HiP', value='HP', tags='video_profile.rule')
-    rebulk.regex('Hi422P', value='Hi422P', tags='video_profile.rule')
-    rebulk.regex('Hi444PP', value='Hi444PP', tags='video_profile.rule')
+    rebulk.string('Hi422P', value='Hi422P', tags='video_profile.rule',
+                  properties={'video_profile': ['Hi422P']})
+    rebulk.string('Hi444PP', value='Hi444PP', tags='video_profile.rule',
+                  properties={'video_profile': ['Hi444PP']})
 
     rebulk.string('DXVA', value='DXVA', name='video_api')
 
@@ -3,7 +3,8 @@
 """
 Website property.
 """
-from pkg_resources import resource_stream  # @UnresolvedImport
+from pkgutil import get_data
+
 from rebulk.remodule import re, REGEX_AVAILABLE
 
 from rebulk import Rebulk
@@ -20,7 +21,7 @@ def website():
     rebulk.defaults(name="website")
 
     tlds = [l.strip().decode('utf-8')
-            for l in resource_stream('guessit', 'tlds-alpha-by-domain.txt').readlines()
+            for l in get_data('guessit', 'tlds-alpha-by-domain.txt').splitlines()
             if b'--' not in l][1:]  # All registered domain extension
 
     safe_tlds = ['com', 'org', 'net']  # For sure a website extension
@@ -36,17 +37,21 @@ def website():
             r'(?:[^a-z0-9]|^)((?:\L<safe_subdomains>\.)*[a-z-]+\.(?:\L<safe_prefix>\.)+(?:\L<tlds>))(?:[^a-z0-9]|$)',
             safe_subdomains=safe_subdomains, safe_prefix=safe_prefix, tlds=tlds, children=True)
     else:
-        rebulk.regex(r'(?:[^a-z0-9]|^)((?:'+build_or_pattern(safe_subdomains) +
-                     r'\.)+(?:[a-z-]+\.)+(?:'+build_or_pattern(tlds) +
+        # Each or pattern is built once, as the one for tlds is large and used twice.
+        safe_subdomains_pattern = build_or_pattern(safe_subdomains)
+        tlds_pattern = build_or_pattern(tlds)
+
+        rebulk.regex(r'(?:[^a-z0-9]|^)((?:' + safe_subdomains_pattern +
+                     r'\.)+(?:[a-z-]+\.)+(?:' + tlds_pattern +
                      r'))(?:[^a-z0-9]|$)',
                      children=True)
-        rebulk.regex(r'(?:[^a-z0-9]|^)((?:'+build_or_pattern(safe_subdomains) +
-                     r'\.)*[a-z-]+\.(?:'+build_or_pattern(safe_tlds) +
+        rebulk.regex(r'(?:[^a-z0-9]|^)((?:' + safe_subdomains_pattern +
+                     r'\.)*[a-z-]+\.(?:' + build_or_pattern(safe_tlds) +
                      r'))(?:[^a-z0-9]|$)',
                      safe_subdomains=safe_subdomains, safe_tlds=safe_tlds, children=True)
-        rebulk.regex(r'(?:[^a-z0-9]|^)((?:'+build_or_pattern(safe_subdomains) +
-                     r'\.)*[a-z-]+\.(?:'+build_or_pattern(safe_prefix) +
-                     r'\.)+(?:'+build_or_pattern(tlds) +
+        rebulk.regex(r'(?:[^a-z0-9]|^)((?:' + safe_subdomains_pattern +
+                     r'\.)*[a-z-]+\.(?:' + build_or_pattern(safe_prefix) +
+                     r'\.)+(?:' + tlds_pattern +
                      r'))(?:[^a-z0-9]|$)',
                      safe_subdomains=safe_subdomains, safe_prefix=safe_prefix, tlds=tlds, children=True)
 
@@ -35,6 +35,10 @@ def test_unicode():
 def test_properties():
     props = properties()
     assert 'video_codec' in props.keys()
+    assert set(props['audio_codec']) <= set([None, 'MP3', 'DolbyDigital', 'DolbyAtmos', 'AAC', 'AC3', 'FLAC', 'DTS',
+                                             'TrueHD'])
+    assert set(props['video_codec']) <= set([None, 'Real', 'Mpeg2', 'DivX', 'XviD', 'h264', 'h265'])
+    assert set(props['screen_size']) >= set(['360p', '368p', '480p', '576p', '720p', '900p', '1080i', '1080p', '4K'])
 
 
 def test_exception():